@@ -41,6 +41,19 @@ from typing import Optional
 from typing import Union
 
 
+def write_if_changed(fname: str, text: str) -> bool:
+    # Leave an unchanged file alone so sphinx does not rebuild it
+    try:
+        with open(fname, 'r') as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    with open(fname, 'w') as f:
+        f.write(text)
+    return True
+
+
 class url_meta:
 
     def __init__(self, project: dict, page_url: str) -> None:
@@ -171,8 +184,8 @@ class generator:
             self.out.append(' ' * self.indent_level + line)
 
     def output(self, out, fname):
-        with open(os.path.join(out, fname) + '.rst', 'w') as f:
-            f.write(os.linesep.join(self.out))
+        write_if_changed(
+            os.path.join(out, fname) + '.rst', os.linesep.join(self.out))
 
     def indent(self, level: int = 0) -> int:
         i = self.indent_level